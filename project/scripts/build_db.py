@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Generate the synthetic datasets and build the SQLite database in one pass.
+
+The standalone generate_data.py -> disk -> ingest_to_sqlite.py pipeline
+serializes every record just to re-parse it moments later. This entrypoint
+feeds the in-memory row tuples straight into the bulk insert, skipping the
+encode/write/read/decode round-trip entirely; --write-artifacts restores the
+on-disk JSON/Parquet copies when they are wanted.
+"""
+from __future__ import annotations
+
+import argparse
+import sqlite3
+
+from generate_data import generate_all, write_all
+from ingest_to_sqlite import DB_PATH, create_indexes, create_tables, insert_all
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse CLI options for artifact persistence."""
+    parser = argparse.ArgumentParser(description="Generate data and build the database in one process")
+    parser.add_argument(
+        "--write-artifacts",
+        action="store_true",
+        help="Also persist the JSON/Parquet dataset files",
+    )
+    return parser.parse_args()
+
+
+def build(write_artifacts: bool = False) -> None:
+    """Generate every dataset and load it into a fresh database."""
+    datasets = generate_all()
+    if write_artifacts:
+        write_all(datasets)
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with sqlite3.connect(DB_PATH) as conn:
+        create_tables(conn)
+        insert_all(conn, datasets)
+        create_indexes(conn)
+        print(f"Database ready at {DB_PATH}")
+
+
+def main() -> None:
+    args = parse_args()
+    build(args.write_artifacts)
+
+
+if __name__ == "__main__":
+    main()
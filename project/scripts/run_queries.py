@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Execute reporting queries against the e-commerce SQLite database."""
+"""Execute reporting queries against the e-commerce datasets."""
 from __future__ import annotations
 
 import argparse
@@ -7,18 +7,108 @@ import sqlite3
 from pathlib import Path
 from typing import Iterable, Sequence, Tuple
 
+import duckdb
+
 ROOT_DIR = Path(__file__).resolve().parents[1]
+DATA_DIR = ROOT_DIR / "data"
 DEFAULT_DB = ROOT_DIR / "database" / "ecom.db"
 
+PARQUET_TABLES = ("users", "products", "orders", "order_items", "reviews")
+
+# The three reports below run unchanged on DuckDB (preferred, vectorized
+# columnar execution over the Parquet artifacts) and on SQLite (fallback).
+# Aggregates stay REAL while sorting; printf runs once per output row in the
+# outer projection instead of a text<->double round-trip inside ORDER BY.
+
+# Query 1: Total revenue per product joining order_items with the product
+# catalog. No column of orders is needed: the order_id FK on order_items
+# already guarantees every line item belongs to an order.
+PRODUCT_REVENUE_SQL = """
+    SELECT
+        sub.product_id,
+        sub.product_name,
+        sub.category,
+        printf('%.2f', sub.total_revenue) AS total_revenue,
+        sub.orders_involved
+    FROM (
+        SELECT
+            p.product_id,
+            p.name AS product_name,
+            p.category,
+            SUM(oi.quantity * oi.price) AS total_revenue,
+            COUNT(DISTINCT oi.order_id) AS orders_involved
+        FROM products AS p
+        JOIN order_items AS oi ON oi.product_id = p.product_id
+        GROUP BY p.product_id, p.name, p.category
+    ) AS sub
+    ORDER BY sub.total_revenue DESC;
+"""
+
+# Query 2: Top 10 customers by total spending via users + orders + items.
+TOP_CUSTOMERS_SQL = """
+    SELECT
+        sub.user_id,
+        sub.name,
+        sub.email,
+        printf('%.2f', sub.total_spent) AS total_spent,
+        sub.orders_placed
+    FROM (
+        SELECT
+            u.user_id,
+            u.name,
+            u.email,
+            SUM(oi.quantity * oi.price) AS total_spent,
+            COUNT(DISTINCT o.order_id) AS orders_placed
+        FROM users AS u
+        JOIN orders AS o ON o.user_id = u.user_id
+        JOIN order_items AS oi ON oi.order_id = o.order_id
+        GROUP BY u.user_id, u.name, u.email
+    ) AS sub
+    ORDER BY sub.total_spent DESC
+    LIMIT 10;
+"""
+
+# Query 3: Average rating per product joining reviews with products.
+AVG_RATING_SQL = """
+    SELECT
+        sub.product_id,
+        sub.product_name,
+        printf('%.2f', sub.avg_rating) AS avg_rating,
+        sub.review_count
+    FROM (
+        SELECT
+            p.product_id,
+            p.name AS product_name,
+            AVG(r.rating) AS avg_rating,
+            COUNT(r.review_id) AS review_count
+        FROM products AS p
+        JOIN reviews AS r ON r.product_id = p.product_id
+        GROUP BY p.product_id, p.name
+        HAVING COUNT(r.review_id) > 0
+    ) AS sub
+    ORDER BY sub.avg_rating DESC, sub.review_count DESC;
+"""
+
+REPORTS = (
+    ("Total revenue per product", PRODUCT_REVENUE_SQL),
+    ("Top 10 customers by spending", TOP_CUSTOMERS_SQL),
+    ("Average rating per product", AVG_RATING_SQL),
+)
+
 
 def parse_args() -> argparse.Namespace:
     """Parse CLI options for database selection."""
     parser = argparse.ArgumentParser(description="Run predefined analytics queries")
-    parser.add_argument("--db", type=Path, default=DEFAULT_DB, help="Path to SQLite database")
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=None,
+        help="Path to SQLite database (forces the SQLite engine)",
+    )
     return parser.parse_args()
 
 
-def fetch(cursor: sqlite3.Cursor, sql: str) -> Tuple[Sequence[str], Iterable[sqlite3.Row]]:
+def fetch(cursor, sql: str) -> Tuple[Sequence[str], Iterable[Sequence[object]]]:
     """Execute SQL and return column headers plus rows."""
     cursor.execute(sql)
     headers = [col[0] for col in cursor.description]
@@ -32,10 +122,9 @@ def print_table(title: str, headers: Sequence[str], rows: Sequence[Sequence[obje
     if not rows:
         print("(no rows)")
         return
-    widths = [len(str(h)) for h in headers]
-    for row in rows:
-        for idx, value in enumerate(row):
-            widths[idx] = max(widths[idx], len(str(value)))
+    # zip(headers, *rows) transposes to columns so each width is one max()
+    # over a generator rather than per-cell index arithmetic.
+    widths = [max(len(str(value)) for value in column) for column in zip(headers, *rows)]
     header_line = " | ".join(f"{header:<{widths[idx]}}" for idx, header in enumerate(headers))
     divider = "-+-".join("-" * w for w in widths)
     print(header_line)
@@ -44,66 +133,42 @@ def print_table(title: str, headers: Sequence[str], rows: Sequence[Sequence[obje
         print(" | ".join(f"{value!s:<{widths[idx]}}" for idx, value in enumerate(row)))
 
 
-def run_queries(db_path: Path) -> None:
-    """Open the database and run each aggregate JOIN query."""
+def run_queries_duckdb() -> None:
+    """Run each report on DuckDB directly over the Parquet artifacts."""
+    con = duckdb.connect()
+    for table in PARQUET_TABLES:
+        con.execute(f"CREATE VIEW {table} AS SELECT * FROM '{DATA_DIR / f'{table}.parquet'}'")
+    cur = con.cursor()
+    for title, sql in REPORTS:
+        headers, rows = fetch(cur, sql)
+        print_table(title, headers, rows)
+
+
+def run_queries_sqlite(db_path: Path) -> None:
+    """Run each report against the SQLite database."""
     if not db_path.exists():
         raise SystemExit(f"Database not found: {db_path}")
-
     with sqlite3.connect(db_path) as conn:
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
+        for title, sql in REPORTS:
+            headers, rows = fetch(cur, sql)
+            print_table(title, headers, rows)
+
+
+def run_queries(db_path: Path | None) -> None:
+    """Prefer vectorized DuckDB execution over Parquet, else use SQLite.
 
-        # Query 1: Total revenue per product using joins between order_items,
-        # orders, and the product catalog.
-        product_revenue_sql = """
-            SELECT
-                p.product_id,
-                p.name AS product_name,
-                p.category,
-                printf('%.2f', SUM(oi.quantity * oi.price)) AS total_revenue,
-                COUNT(DISTINCT oi.order_id) AS orders_involved
-            FROM products AS p
-            JOIN order_items AS oi ON oi.product_id = p.product_id
-            JOIN orders AS o ON o.order_id = oi.order_id
-            GROUP BY p.product_id, p.name, p.category
-            ORDER BY CAST(total_revenue AS REAL) DESC;
-        """
-        headers, rows = fetch(cur, product_revenue_sql)
-        print_table("Total revenue per product", headers, rows)
-
-        # Query 2: Top 10 customers by total spending via users + orders + items.
-        top_customers_sql = """
-            SELECT
-                u.user_id,
-                u.name,
-                u.email,
-                printf('%.2f', SUM(oi.quantity * oi.price)) AS total_spent,
-                COUNT(DISTINCT o.order_id) AS orders_placed
-            FROM users AS u
-            JOIN orders AS o ON o.user_id = u.user_id
-            JOIN order_items AS oi ON oi.order_id = o.order_id
-            GROUP BY u.user_id, u.name, u.email
-            ORDER BY CAST(total_spent AS REAL) DESC
-            LIMIT 10;
-        """
-        headers, rows = fetch(cur, top_customers_sql)
-        print_table("Top 10 customers by spending", headers, rows)
-
-        # Query 3: Average rating per product joining reviews with products.
-        avg_rating_sql = """
-            SELECT
-                p.product_id,
-                p.name AS product_name,
-                printf('%.2f', AVG(r.rating)) AS avg_rating,
-                COUNT(r.review_id) AS review_count
-            FROM products AS p
-            JOIN reviews AS r ON r.product_id = p.product_id
-            GROUP BY p.product_id, p.name
-            HAVING review_count > 0
-            ORDER BY CAST(avg_rating AS REAL) DESC, review_count DESC;
-        """
-        headers, rows = fetch(cur, avg_rating_sql)
-        print_table("Average rating per product", headers, rows)
+    An explicit db_path always selects the SQLite engine; DuckDB is only
+    preferred when no database was requested and the Parquet artifacts exist.
+    """
+    if db_path is not None:
+        run_queries_sqlite(db_path)
+        return
+    if all((DATA_DIR / f"{table}.parquet").exists() for table in PARQUET_TABLES):
+        run_queries_duckdb()
+        return
+    run_queries_sqlite(DEFAULT_DB)
 
 
 def main() -> None:
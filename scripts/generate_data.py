@@ -3,16 +3,18 @@
 from __future__ import annotations
 
 import csv
-import random
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, List
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 BASE_DIR = Path(__file__).resolve().parents[1]
 DATA_DIR = BASE_DIR / "data"
 
-random.seed(2025)
+RNG = np.random.default_rng(2025)
 
 FIRST_NAMES = ["Avery", "Brooke", "Cameron", "Dakota", "Elliot", "Finley", "Harper", "Jordan", "Kai", "Logan"]
 LAST_NAMES = ["Smith", "Johnson", "Lee", "Patel", "Garcia", "Brown", "Martinez", "Lopez", "Kim", "Reyes"]
@@ -35,9 +37,16 @@ REVIEW_COMMENTS = [
     "Impressed with the durability",
 ]
 
-def random_date(start: datetime, end: datetime) -> datetime:
-    delta = end - start
-    return start + timedelta(seconds=random.randint(0, int(delta.total_seconds())))
+def random_dates(start: datetime, end: datetime, count: int) -> List[str]:
+    delta = int((end - start).total_seconds())
+    offsets = RNG.integers(0, delta, size=count, endpoint=True)
+    return (np.datetime64(start, "s") + offsets.astype("timedelta64[s]")).astype(str).tolist()
+
+
+def pick(values: Iterable[object], count: int) -> List[object]:
+    """Sample `count` values with replacement via one vectorized draw."""
+    arr = np.asarray(list(values))
+    return arr[RNG.integers(0, len(arr), size=count)].tolist()
 
 
 def write_csv(path: Path, headers: Iterable[str], rows: Iterable[Iterable[object]]) -> None:
@@ -48,80 +57,113 @@ def write_csv(path: Path, headers: Iterable[str], rows: Iterable[Iterable[object
         writer.writerows(rows)
 
 
+def write_parquet(path: Path, headers: List[str], rows: List[tuple]) -> None:
+    """Write rows as a Snappy-compressed Parquet table alongside the CSV.
+
+    Ingestion prefers the Parquet copy: typed binary columns need no text
+    parsing and compress better than CSV.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    columns = list(zip(*rows)) if rows else [[] for _ in headers]
+    pq.write_table(pa.Table.from_pydict(dict(zip(headers, columns))), path, compression="snappy")
+
+
 def generate() -> None:
     now = datetime.now()
-    users = []
-    for user_id in range(1, 51):
-        first = random.choice(FIRST_NAMES)
-        last = random.choice(LAST_NAMES)
-        city, country = random.choice(CITIES)
-        users.append(
-            (
-                user_id,
-                first,
-                last,
-                f"{first.lower()}.{last.lower()}{user_id}@example.com",
-                random_date(datetime(2019, 1, 1), now).isoformat(),
-                country,
-            )
+    firsts = pick(FIRST_NAMES, 50)
+    lasts = pick(LAST_NAMES, 50)
+    countries = pick([country for _, country in CITIES], 50)
+    signup_dates = random_dates(datetime(2019, 1, 1), now, 50)
+    users = [
+        (
+            user_id,
+            first,
+            last,
+            f"{first.lower()}.{last.lower()}{user_id}@example.com",
+            signup,
+            country,
+        )
+        for user_id, (first, last, signup, country) in enumerate(
+            zip(firsts, lasts, signup_dates, countries), start=1
         )
+    ]
 
-    products = []
     adjectives = ["Wireless", "Smart", "Eco", "Ultra", "Compact", "Pro"]
     nouns = ["Speaker", "Lamp", "Backpack", "Tent", "Cookbook", "Serum", "Drone", "Headset"]
-    price_lookup = {}
-    for product_id in range(1, 41):
-        name = f"{random.choice(adjectives)} {random.choice(nouns)}"
-        category = random.choice(PRODUCT_CATEGORIES)
-        price = round(random.uniform(10, 600), 2)
-        stock = random.randint(25, 500)
-        products.append((product_id, name, category, price, stock))
-        price_lookup[product_id] = price
-
-    orders = []
-    for order_id in range(1, 101):
-        user_id = random.randint(1, 50)
-        order_date = random_date(datetime(2021, 1, 1), now).isoformat()
-        status = random.choice(ORDER_STATUSES)
-        address = f"{random.randint(100, 9999)} {random.choice(['Oak', 'Pine', 'Cedar', 'Maple'])} St"
-        orders.append((order_id, user_id, order_date, status, address, 0.0))
-
-    order_items = []
-    for order_item_id in range(1, 201):
-        order = random.randint(1, 100)
-        product = random.randint(1, 40)
-        quantity = random.randint(1, 5)
-        unit_price = price_lookup[product]
-        line_total = round(quantity * unit_price, 2)
-        order_items.append((order_item_id, order, product, quantity, unit_price, line_total))
-
-    # Update order totals
-    totals = {order_id: 0.0 for order_id in range(1, 101)}
-    for _, order_id, _, _, _, line_total in order_items:
-        totals[order_id] += line_total
-    orders = [(*order[:5], round(totals[order[0]], 2)) for order in orders]
-
-    reviews = []
-    for review_id in range(1, 81):
-        user_id = random.randint(1, 50)
-        product_id = random.randint(1, 40)
-        rating = random.randint(1, 5)
-        comment = random.choice(REVIEW_COMMENTS)
-        reviews.append((review_id, user_id, product_id, rating, comment))
-
-    write_csv(DATA_DIR / "users.csv", ["user_id", "first_name", "last_name", "email", "signup_date", "country"], users)
-    write_csv(DATA_DIR / "products.csv", ["product_id", "name", "category", "price", "stock"], products)
-    write_csv(
-        DATA_DIR / "orders.csv",
-        ["order_id", "user_id", "order_date", "status", "shipping_address", "total_amount"],
-        orders,
-    )
-    write_csv(
-        DATA_DIR / "order_items.csv",
-        ["order_item_id", "order_id", "product_id", "quantity", "unit_price", "line_total"],
-        order_items,
-    )
-    write_csv(DATA_DIR / "reviews.csv", ["review_id", "user_id", "product_id", "rating", "comment"], reviews)
+    names = [f"{adj} {noun}" for adj, noun in zip(pick(adjectives, 40), pick(nouns, 40))]
+    categories = pick(PRODUCT_CATEGORIES, 40)
+    price_arr = np.round(RNG.uniform(10, 600, size=40), 2)
+    stocks = RNG.integers(25, 500, size=40, endpoint=True).tolist()
+    products = [
+        (product_id, name, category, price, stock)
+        for product_id, (name, category, price, stock) in enumerate(
+            zip(names, categories, price_arr.tolist(), stocks), start=1
+        )
+    ]
+
+    order_user_ids = RNG.integers(1, 50, size=100, endpoint=True).tolist()
+    order_dates = random_dates(datetime(2021, 1, 1), now, 100)
+    statuses = pick(ORDER_STATUSES, 100)
+    street_nums = RNG.integers(100, 9999, size=100, endpoint=True).tolist()
+    street_names = pick(["Oak", "Pine", "Cedar", "Maple"], 100)
+    orders = [
+        (order_id, user_id, order_date, status, f"{num} {street} St", 0.0)
+        for order_id, (user_id, order_date, status, num, street) in enumerate(
+            zip(order_user_ids, order_dates, statuses, street_nums, street_names), start=1
+        )
+    ]
+
+    item_order_ids = RNG.integers(1, 100, size=200, endpoint=True).tolist()
+    item_product_idx = RNG.integers(0, 40, size=200)
+    quantities = RNG.integers(1, 5, size=200, endpoint=True)
+    unit_prices = price_arr[item_product_idx]
+    line_totals = np.round(quantities * unit_prices, 2)
+    order_items = [
+        (order_item_id, order_id, product_id, quantity, unit_price, line_total)
+        for order_item_id, (order_id, product_id, quantity, unit_price, line_total) in enumerate(
+            zip(
+                item_order_ids,
+                (item_product_idx + 1).tolist(),
+                quantities.tolist(),
+                unit_prices.tolist(),
+                line_totals.tolist(),
+            ),
+            start=1,
+        )
+    ]
+
+    # Update order totals with one bincount pass over the line-item arrays
+    totals = np.bincount(np.asarray(item_order_ids), weights=line_totals, minlength=101)
+    totals = np.round(totals, 2).tolist()
+    orders = [(*order[:5], totals[order[0]]) for order in orders]
+
+    review_user_ids = RNG.integers(1, 50, size=80, endpoint=True).tolist()
+    review_product_ids = RNG.integers(1, 40, size=80, endpoint=True).tolist()
+    ratings = RNG.integers(1, 5, size=80, endpoint=True).tolist()
+    comments = pick(REVIEW_COMMENTS, 80)
+    reviews = [
+        (review_id, user_id, product_id, rating, comment)
+        for review_id, (user_id, product_id, rating, comment) in enumerate(
+            zip(review_user_ids, review_product_ids, ratings, comments), start=1
+        )
+    ]
+
+    tables = {
+        "users": (["user_id", "first_name", "last_name", "email", "signup_date", "country"], users),
+        "products": (["product_id", "name", "category", "price", "stock"], products),
+        "orders": (
+            ["order_id", "user_id", "order_date", "status", "shipping_address", "total_amount"],
+            orders,
+        ),
+        "order_items": (
+            ["order_item_id", "order_id", "product_id", "quantity", "unit_price", "line_total"],
+            order_items,
+        ),
+        "reviews": (["review_id", "user_id", "product_id", "rating", "comment"], reviews),
+    }
+    for name, (headers, rows) in tables.items():
+        write_csv(DATA_DIR / f"{name}.csv", headers, rows)
+        write_parquet(DATA_DIR / f"{name}.parquet", headers, rows)
 
     print(f"Synthetic CSV datasets written to {DATA_DIR}")
 
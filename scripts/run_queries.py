@@ -28,10 +28,9 @@ def print_table(title: str, headers: Sequence[str], rows: Sequence[Sequence[obje
     if not rows:
         print("(no rows)")
         return
-    widths = [len(str(h)) for h in headers]
-    for row in rows:
-        for idx, value in enumerate(row):
-            widths[idx] = max(widths[idx], len(str(value)))
+    # zip(headers, *rows) transposes to columns so each width is one max()
+    # over a generator rather than per-cell index arithmetic.
+    widths = [max(len(str(value)) for value in column) for column in zip(headers, *rows)]
     header_line = " | ".join(f"{header:<{widths[idx]}}" for idx, header in enumerate(headers))
     divider = "-+-".join("-" * w for w in widths)
     print(header_line)
@@ -79,16 +78,25 @@ def run_reports(db_path: Path) -> None:
         headers, rows = fetch(cur, total_sales)
         print_table("Total sales", headers, rows)
 
+        # Sort on the raw REAL aggregate and format only in the outer
+        # projection, avoiding a text<->double round-trip in ORDER BY.
         top_product = """
             SELECT
-                p.product_id,
-                p.name AS product_name,
-                SUM(oi.quantity) AS units_sold,
-                printf('%.2f', SUM(oi.line_total)) AS revenue
-            FROM products AS p
-            JOIN order_items AS oi ON oi.product_id = p.product_id
-            GROUP BY p.product_id, p.name
-            ORDER BY units_sold DESC, CAST(revenue AS REAL) DESC
+                sub.product_id,
+                sub.product_name,
+                sub.units_sold,
+                printf('%.2f', sub.revenue) AS revenue
+            FROM (
+                SELECT
+                    p.product_id,
+                    p.name AS product_name,
+                    SUM(oi.quantity) AS units_sold,
+                    SUM(oi.line_total) AS revenue
+                FROM products AS p
+                JOIN order_items AS oi ON oi.product_id = p.product_id
+                GROUP BY p.product_id, p.name
+            ) AS sub
+            ORDER BY sub.units_sold DESC, sub.revenue DESC
             LIMIT 5;
         """
         headers, rows = fetch(cur, top_product)